@@ -0,0 +1,59 @@
+"""Benchmark: time per invocation of the app versus the daemon client
+
+Usage: python benchmarks/startup.py [INPUT_FILE] [RUNS]
+
+Starts a daemon on a temporary socket, then runs the app (src/app.py) and the client
+(src/client.py) RUNS times each on INPUT_FILE, printing the mean and median time per run.
+"""
+import os
+import statistics
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def time_runs(cmd, runs, env, work_dir):
+    """Runs cmd runs times from work_dir. Returns the list of elapsed times in milliseconds."""
+    times = []
+    for _run in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, check=True, env=env, cwd=work_dir, stdout=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    """Prints the time per run of each command"""
+    in_file = os.path.abspath(sys.argv[1] if len(sys.argv) > 1 else
+                              os.path.join(ROOT_DIR, "clients.txt"))
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    with TemporaryDirectory() as work_dir:
+        out_file = os.path.join(work_dir, "out.txt")
+        # Runs from work_dir so the logs of each command don't end up in the repository
+        env = dict(os.environ, PYTHONPATH=ROOT_DIR,
+                   BALANCER_SOCKET=os.path.join(work_dir, "balancer.sock"))
+        daemon = subprocess.Popen([sys.executable, os.path.join(ROOT_DIR, "src", "daemon.py"), "1"],
+                                  env=env, cwd=work_dir)
+        try:
+            while not os.path.exists(env["BALANCER_SOCKET"]):
+                time.sleep(0.05)
+            commands = {
+                "python (empty)": [sys.executable, "-c", "pass"],
+                "app": [sys.executable, os.path.join(ROOT_DIR, "src", "app.py"), in_file, out_file],
+                "client": [sys.executable, os.path.join(ROOT_DIR, "src", "client.py"), in_file,
+                           out_file],
+            }
+            for name, cmd in commands.items():
+                times = time_runs(cmd, runs, env, work_dir)
+                print(f"{name:15} mean: {statistics.mean(times):7.2f} ms  "
+                      f"median: {statistics.median(times):7.2f} ms")
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+
+if __name__ == "__main__":
+    main()
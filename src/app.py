@@ -4,52 +4,57 @@ from os import environ
 import sys
 
 from src.error import BalancerError
+from src.conf import LOG_FILE
 from src.load_balance import LoadBalancer
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    filename="balancer.log",
-    format="%(asctime)s - %(levelname)s - %(name)s:%(lineno)d - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
-
 logger = logging.getLogger(__name__)
 
 
+def setup_logging():
+    """Sends the logs of all modules to LOG_FILE"""
+    logging.basicConfig(
+        level=logging.DEBUG,
+        filename=LOG_FILE,
+        format="%(asctime)s - %(levelname)s - %(name)s:%(lineno)d - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
+
 def usage():
     "Prints how to use this program and exits with error."
     if "DOCKER" in environ and environ["DOCKER"] == "True":
-        print("USAGE - Docker mode: load_balance INPUT_FILE")
+        print("USAGE - Docker mode: load_balance INPUT_FILE [- METRICS_FILE]")
     else:
-        print("USAGE: load_balance INPUT_FILE [OUTPUT_FILE]")
+        print("USAGE: load_balance INPUT_FILE [OUTPUT_FILE [METRICS_FILE]]")
     sys.exit(1)
 
 
 def validate_parameters():
     """Validates the paramters used to call the app"""
     param_count = len(sys.argv)
-    if param_count < 2 or param_count > 3:
+    if param_count < 2 or param_count > 4:
         usage()
-    if param_count == 3:
+    # "-" sends the result to sys.stdout, so a METRICS_FILE can be used without an output file
+    out_file = sys.argv[2] if param_count >= 3 and sys.argv[2] != "-" else None
+    if out_file is not None:
         if "DOCKER" in environ and environ["DOCKER"] == "True":
             print("While running this app in a Docker container it's not allowed to use output "
                   "parameter.")
             usage()
-        out_file = sys.argv[2]
-    else:
-        out_file = None
+    metrics_file = sys.argv[3] if param_count == 4 else None
 
     in_file = sys.argv[1]
-    return in_file, out_file
+    return in_file, out_file, metrics_file
 
 
 def main():
     """Main app function. Starts the app"""
-    in_file, out_file = validate_parameters()
+    in_file, out_file, metrics_file = validate_parameters()
+    setup_logging()
     # pylint: disable=broad-except
     # pylint: disable=invalid-name
     try:
-        lb = LoadBalancer(in_file, out_file)
+        lb = LoadBalancer(in_file, out_file, metrics_file)
         lb.load_balance()
     except BalancerError as e:
         logger.error(e)
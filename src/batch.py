@@ -0,0 +1,145 @@
+"""Batch mode: simulates many input files in one invocation using a pool of processes
+
+Usage: python src/batch.py SOURCE OUTPUT_DIR [WORKERS]
+
+SOURCE can be a directory (all files in it), a manifest file (one input file per line, relative
+paths are relative to the manifest directory) or a glob pattern.
+"""
+import csv
+import glob
+import logging
+from multiprocessing import Pool
+import os
+import sys
+
+from src.app import setup_logging
+from src.error import BalancerError
+from src.conf import BATCH_SUMMARY_FILE
+from src.load_balance import LoadBalancer
+
+
+logger = logging.getLogger(__name__)
+
+
+def find_traces(source):
+    """Returns the list of input files from a directory, a manifest file or a glob pattern"""
+    if os.path.isdir(source):
+        traces = [os.path.join(source, name) for name in sorted(os.listdir(source))
+                  if os.path.isfile(os.path.join(source, name))]
+    elif os.path.isfile(source):
+        manifest_dir = os.path.dirname(source)
+        with open(source, "rt") as manifest:
+            traces = [os.path.join(manifest_dir, line.strip()) for line in manifest
+                      if line.strip()]
+    else:
+        traces = sorted(path for path in glob.glob(source) if os.path.isfile(path))
+    if not traces:
+        raise BalancerError(f"No input files found in '{source}'.")
+    return traces
+
+
+def _output_files(traces, out_dir):
+    """Maps each input file to an output file named <input file name>.out in out_dir"""
+    out_files = {}
+    for trace in traces:
+        out_file = os.path.join(out_dir, f"{os.path.basename(trace)}.out")
+        if out_file in out_files.values():
+            raise BalancerError(f"More than one input file named '{os.path.basename(trace)}'.")
+        out_files[trace] = out_file
+    return out_files
+
+
+def simulate(job):
+    """Runs the LoadBalancer for a given (input file, output file) pair.
+
+       Returns a tuple with input file, ticks, total cost and error message (None if no error)."""
+    in_file, out_file = job
+    # pylint: disable=broad-except
+    # pylint: disable=invalid-name
+    try:
+        lb = LoadBalancer(in_file, out_file)
+        cost = lb.load_balance()
+        return in_file, lb.tick_count, cost, None
+    except BalancerError as e:
+        logger.error("%s: %s", in_file, e)
+        return in_file, None, None, str(e)
+    except Exception:
+        logger.exception("System failure - unpredicted error running %s", in_file)
+        return in_file, None, None, "Internal failure, please check the logs for more detail."
+
+
+def _write_summary(results, out_dir):
+    """Writes the cost of each input file and the total cost to BATCH_SUMMARY_FILE"""
+    total_cost = sum(cost for _in_file, _ticks, cost, error in results if error is None)
+    with open(os.path.join(out_dir, BATCH_SUMMARY_FILE), "wt", newline="") as summary:
+        writer = csv.writer(summary)
+        writer.writerow(["input_file", "ticks", "cost", "error"])
+        writer.writerows(results)
+        writer.writerow(["TOTAL", "", total_cost, ""])
+    return total_cost
+
+
+def run_batch(source, out_dir, workers=None):
+    """Simulates all input files found in source writing results to out_dir.
+
+       Files are dispatched one at a time to the pool, biggest first, so idle workers keep taking
+       the next pending file and a few big files don't hold up the batch.
+       Returns the list of results (see simulate) sorted by input file and the total cost."""
+    if not os.path.isdir(out_dir):
+        raise BalancerError(f"Path '{out_dir}' is not a valid directory.")
+    if not os.access(out_dir, os.W_OK):
+        raise BalancerError(f"Access denied to write to direcoty '{out_dir}'.")
+    out_files = _output_files(find_traces(source), out_dir)
+    # Missing files go last: simulate reports them as not found in the summary
+    jobs = sorted(out_files.items(), reverse=True,
+                  key=lambda job: os.path.getsize(job[0]) if os.path.isfile(job[0]) else 0)
+    logger.info("Running batch of %s files", len(jobs))
+    with Pool(workers, initializer=setup_logging) as pool:
+        results = sorted(pool.imap_unordered(simulate, jobs, chunksize=1))
+    return results, _write_summary(results, out_dir)
+
+
+def usage():
+    "Prints how to use this program and exits with error."
+    print("USAGE: batch SOURCE OUTPUT_DIR [WORKERS]")
+    sys.exit(1)
+
+
+def validate_parameters():
+    """Validates the paramters used to call the app"""
+    param_count = len(sys.argv)
+    if param_count < 3 or param_count > 4:
+        usage()
+    workers = None
+    if param_count == 4:
+        if not sys.argv[3].isdigit() or int(sys.argv[3]) < 1:
+            print("WORKERS must be a positive integer.")
+            usage()
+        workers = int(sys.argv[3])
+    return sys.argv[1], sys.argv[2], workers
+
+
+def main():
+    """Batch app function. Simulates all input files and prints the total cost"""
+    source, out_dir, workers = validate_parameters()
+    setup_logging()
+    # pylint: disable=broad-except
+    # pylint: disable=invalid-name
+    try:
+        results, total_cost = run_batch(source, out_dir, workers)
+    except BalancerError as e:
+        logger.error(e)
+        print(e)
+        return
+    except Exception:
+        logger.exception("System failure - unpredicted error")
+        print("Internal failure, please check the logs for more detail.")
+        return
+    for in_file, _ticks, _cost, error in results:
+        if error is not None:
+            print(f"{in_file}: {error}")
+    print(total_cost)
+
+
+if __name__ == "__main__":
+    main()
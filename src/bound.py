@@ -0,0 +1,121 @@
+"""Theoretical minimum cost (lower bound) of a trace and efficiency report of the simulation
+
+Usage: python src/bound.py INPUT_FILE [METRICS_FILE]
+
+At any tick no allocation can run fewer than ceil(live tasks / umax) servers, where the live tasks
+are the clients that arrived in the last ttask ticks. The sum of this value over all ticks is a
+lower bound for the server-ticks of the trace.
+"""
+from array import array
+from heapq import nlargest
+from itertools import accumulate, chain, repeat, tee, zip_longest
+import logging
+from operator import floordiv, itemgetter, neg, sub
+import os
+import sys
+from tempfile import TemporaryDirectory
+
+from src.app import setup_logging
+from src.error import BalancerError
+from src.conf import SERVER_COST, BOUND_HOTSPOTS
+from src.load_balance import LoadBalancer
+from src.metrics import load_metrics
+from src.trace import iter_clients, open_trace, read_limits
+
+
+logger = logging.getLogger(__name__)
+
+
+def tick_lower_bounds(ttask, umax, clients):
+    """Returns an iterator with the minimum number of servers per tick.
+
+       Live tasks are computed as a sliding window of width ttask over prefix sums of the new
+       clients. Runs in linear time using only iterators implemented in C and keeps at most ttask
+       values in memory, so clients can be a lazy iterator over a very large trace."""
+    ticks_end, ticks_start = tee(chain(clients, repeat(0, ttask - 1)))
+    window_end, window_start = accumulate(ticks_end), accumulate(ticks_start)
+    live_tasks = map(sub, window_end, chain(repeat(0, ttask), window_start))
+    # ceil(live_tasks / umax) == -(-live_tasks // umax)
+    return map(neg, map(floordiv, map(neg, live_tasks), repeat(umax)))
+
+
+def lower_bound(file_name):
+    """Streams a trace file and returns the lower bound of its cost"""
+    with open_trace(file_name) as file_in:
+        ttask, umax = read_limits(file_in)
+        return sum(tick_lower_bounds(ttask, umax, iter_clients(file_in, ttask))) * SERVER_COST
+
+
+def _simulate_servers(file_name):
+    """Runs the LoadBalancer on a trace and returns the servers running per tick"""
+    with TemporaryDirectory() as work_dir:
+        out_file = os.path.join(work_dir, "out.txt")
+        prefix = os.path.join(work_dir, "metrics")
+        open(out_file, "wt").close()
+        LoadBalancer(file_name, out_file, prefix).load_balance()
+        return load_metrics(prefix)["servers"]
+
+
+def efficiency_report(file_name, metrics_file=None, top=BOUND_HOTSPOTS):
+    """Compares the simulated cost of a trace with its lower bound.
+
+       Uses the servers per tick saved in metrics_file if informed, otherwise runs the simulation.
+       Returns a dict with the simulated cost, the lower bound, the efficiency (lower bound /
+       cost) and the top ticks with most servers above the lower bound as tuples of
+       (tick, simulated servers, lower bound)."""
+    with open_trace(file_name) as file_in:
+        ttask, umax = read_limits(file_in)
+        bounds = array("q", tick_lower_bounds(ttask, umax, iter_clients(file_in, ttask)))
+    if metrics_file is None:
+        servers = _simulate_servers(file_name)
+    else:
+        servers = load_metrics(metrics_file)["servers"]
+    cost = sum(servers) * SERVER_COST
+    bound = sum(bounds) * SERVER_COST
+    ticks = zip_longest(servers, bounds, fillvalue=0)
+    wastes = ((tick_servers - tick_bound, tick, tick_servers, tick_bound)
+              for tick, (tick_servers, tick_bound) in enumerate(ticks, start=1)
+              if tick_servers > tick_bound)
+    hotspots = [waste[1:] for waste in nlargest(top, wastes, key=itemgetter(0))]
+    return {
+        "cost": cost,
+        "lower_bound": bound,
+        "efficiency": bound / cost if cost else 1.0,
+        "hotspots": hotspots,
+    }
+
+
+def usage():
+    "Prints how to use this program and exits with error."
+    print("USAGE: bound INPUT_FILE [METRICS_FILE]")
+    sys.exit(1)
+
+
+def main():
+    """Prints the efficiency report of a trace"""
+    if len(sys.argv) < 2 or len(sys.argv) > 3:
+        usage()
+    metrics_file = sys.argv[2] if len(sys.argv) == 3 else None
+    setup_logging()
+    # pylint: disable=broad-except
+    # pylint: disable=invalid-name
+    try:
+        report = efficiency_report(sys.argv[1], metrics_file)
+    except BalancerError as e:
+        logger.error(e)
+        print(e)
+        return
+    except Exception:
+        logger.exception("System failure - unpredicted error")
+        print("Internal failure, please check the logs for more detail.")
+        return
+    print(f"Simulated cost: {report['cost']}")
+    print(f"Lower bound: {report['lower_bound']}")
+    print(f"Efficiency: {report['efficiency']:.2%}")
+    print("Waste hotspots (tick: simulated servers / lower bound):")
+    for tick, tick_servers, tick_bound in report["hotspots"]:
+        print(f"{tick}: {tick_servers} / {tick_bound}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Thin client of the daemon mode (src/daemon.py)
+
+Usage: python src/client.py INPUT_FILE [OUTPUT_FILE]
+
+Sends the simulation to a running daemon, avoiding the start up of the simulator in every run.
+Only imports small modules so the client starts as fast as possible.
+"""
+# The socket module imports enum and selectors, which take longer than the simulation of a small
+# input. The _socket C module has all this client needs.
+import _socket
+import os
+import sys
+
+from src.conf import DAEMON_SOCKET
+
+
+def usage():
+    "Prints how to use this program and exits with error."
+    print("USAGE: client INPUT_FILE [OUTPUT_FILE]")
+    sys.exit(1)
+
+
+def request(path, in_file, out_file=None):
+    """Sends a request to the daemon listening on path.
+
+       Returns the cost (None on error) and the result text, or the error message.
+       An empty or malformed response (daemon stopped or failed while running the request) is
+       returned as an error."""
+    out_file = "" if out_file is None else os.path.abspath(out_file)
+    sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        sock.sendall(f"{os.path.abspath(in_file)}\t{out_file}\n".encode())
+        chunks = []
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+    finally:
+        sock.close()
+    try:
+        status, response = b"".join(chunks).decode().split("\n", 1)
+        status, value = status.split("\t", 1)
+        if status == "OK":
+            return float(value), response
+    except ValueError:
+        return None, "Invalid response from the daemon, please check the logs for more detail."
+    return None, value
+
+
+def main():
+    """Client app function. Prints the result or the error returned by the daemon"""
+    if len(sys.argv) < 2 or len(sys.argv) > 3:
+        usage()
+    out_file = sys.argv[2] if len(sys.argv) == 3 and sys.argv[2] != "-" else None
+    path = os.environ.get("BALANCER_SOCKET", DAEMON_SOCKET)
+    try:
+        cost, text = request(path, sys.argv[1], out_file)
+    except OSError as e:
+        print(f"Daemon not running on {path} ({e.strerror}). Start it with: python src/daemon.py")
+        sys.exit(1)
+    if cost is None:
+        print(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 """Configuration file"""
+import os
 
 SERVER_COST = 1.0
 TTASK_MIN = 1
@@ -6,3 +7,12 @@ TTASK_MAX = 10
 UMAX_MIN = 1
 UMAX_MAX = 10
 OVERWRITE_DEST_FILE = True
+METRICS_CHUNK_SIZE = 65536
+BOUND_HOTSPOTS = 10
+LOG_FILE = "balancer.log"
+BATCH_SUMMARY_FILE = "summary.csv"
+SHARD_POLICY = "round_robin"
+# Per user socket, so other users can't create it first and pose as the daemon
+DAEMON_SOCKET = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp",
+    f"load_balancer-{os.getuid()}.sock")
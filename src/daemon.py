@@ -0,0 +1,152 @@
+"""Daemon mode: keeps warm worker processes serving simulations over a Unix socket
+
+Usage: python src/daemon.py [WORKERS]
+
+The socket path is DAEMON_SOCKET, or the BALANCER_SOCKET environment variable if set. Use
+src/client.py to send requests. The protocol is line based so the client doesn't need to import
+a parser:
+
+    request:  <input file>\t<output file>\n
+    response: OK\t<cost>\n<result text>  or  ERROR\t<message>\n
+
+Paths are absolute. With an empty output file the result text is sent in the response.
+"""
+import logging
+from multiprocessing import Pool
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+from tempfile import TemporaryDirectory
+
+from src.app import setup_logging
+from src.batch import simulate
+from src.error import BalancerError
+from src.conf import DAEMON_SOCKET
+
+
+logger = logging.getLogger(__name__)
+
+
+def socket_path():
+    """Returns the path of the daemon socket"""
+    return os.environ.get("BALANCER_SOCKET", DAEMON_SOCKET)
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Reads a request from the socket, runs it and writes back the response"""
+    def handle(self):
+        if not (line := self.rfile.readline()):
+            return
+        try:
+            in_file, out_file = line.decode().rstrip("\n").split("\t")
+        except (UnicodeDecodeError, ValueError):
+            self.wfile.write(b"ERROR\tInvalid request.\n")
+            return
+        self.wfile.write(self.server.run(in_file, out_file or None).encode())
+
+
+class BalancerServer(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server running each request in a pool of warm worker processes"""
+    daemon_threads = True
+
+    def __init__(self, path, workers=None):
+        self.path = path
+        self._check_socket()
+        self.pool = Pool(workers, initializer=setup_logging)
+        try:
+            super().__init__(path, RequestHandler)
+        except OSError as e:
+            self.pool.terminate()
+            raise BalancerError(f"Can't use socket {path}: {e.strerror}.") from e
+
+    def _check_socket(self):
+        """Removes a socket file left by a daemon that is no longer running"""
+        if not os.path.exists(self.path):
+            return
+        if not stat.S_ISSOCK(os.stat(self.path).st_mode):
+            raise BalancerError(f"Path '{self.path}' already exists and is not a socket.")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(self.path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                logger.info("Removing stale socket %s", self.path)
+                try:
+                    os.unlink(self.path)
+                except OSError as e:
+                    raise BalancerError(f"Can't remove socket {self.path}: {e.strerror}.") from e
+                return
+            except OSError as e:
+                raise BalancerError(f"Can't use socket {self.path}: {e.strerror}.") from e
+        raise BalancerError(f"Daemon already running on {self.path}.")
+
+    def run(self, in_file, out_file=None):
+        """Simulates in_file in a worker process. Returns the response text."""
+        logger.info("Request: %s %s", in_file, out_file)
+        if out_file is not None:
+            _in_file, _ticks, cost, error = self.pool.apply(simulate, ((in_file, out_file),))
+            return f"ERROR\t{error}\n" if error is not None else f"OK\t{cost}\n"
+        with TemporaryDirectory() as work_dir:
+            tmp_out_file = os.path.join(work_dir, "out.txt")
+            _in_file, _ticks, cost, error = self.pool.apply(simulate, ((in_file, tmp_out_file),))
+            if error is not None:
+                return f"ERROR\t{error}\n"
+            with open(tmp_out_file, "rt") as file_out:
+                return f"OK\t{cost}\n{file_out.read()}"
+
+    def server_close(self):
+        super().server_close()
+        self.pool.close()
+        self.pool.join()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+def _stop(_signum, _frame):
+    """Stops the daemon on SIGTERM the same way as on Ctrl+C"""
+    raise KeyboardInterrupt
+
+
+def usage():
+    "Prints how to use this program and exits with error."
+    print("USAGE: daemon [WORKERS]")
+    sys.exit(1)
+
+
+def validate_parameters():
+    """Validates the paramters used to call the app"""
+    param_count = len(sys.argv)
+    if param_count > 2:
+        usage()
+    if param_count == 2:
+        if not sys.argv[1].isdigit() or int(sys.argv[1]) < 1:
+            print("WORKERS must be a positive integer.")
+            usage()
+        return int(sys.argv[1])
+    return None
+
+
+def main():
+    """Daemon app function. Serves requests until interrupted"""
+    workers = validate_parameters()
+    setup_logging()
+    # pylint: disable=invalid-name
+    try:
+        server = BalancerServer(socket_path(), workers)
+    except BalancerError as e:
+        logger.error(e)
+        print(e)
+        return
+    signal.signal(signal.SIGTERM, _stop)
+    logger.info("Daemon listening on %s", server.path)
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
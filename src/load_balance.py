@@ -5,26 +5,55 @@ import sys
 
 from src.error import BalancerError
 from src.conf import SERVER_COST, TTASK_MIN, TTASK_MAX, UMAX_MIN, UMAX_MAX, OVERWRITE_DEST_FILE
+from src.metrics import MetricsRecorder
 
 
 logger = logging.getLogger(__name__)
 
 
+def open_write(file_name):
+    """Checks if the output file is OK and opens it in write mode (sys.stdout if file_name is
+       None)"""
+    if file_name is None:
+        return sys.stdout
+
+    if not (file_dir := os.path.dirname(file_name)):
+        file_dir = "./"
+    else:
+        if not os.path.isdir(file_dir):
+            raise BalancerError("Path '{file_dir}' is not a valid directory.")
+    if not os.access(file_dir, os.W_OK):
+        raise BalancerError("Access denied to write to direcoty '{file_dir}'.")
+    if os.path.isfile(file_name):
+        if not OVERWRITE_DEST_FILE:
+            raise BalancerError("Destination file already exists and can't be overwriten. "
+                                "You can change default behavior in conf file. "
+                                "Look for OVERWRITE_DEST_FILE.")
+        if not os.access(file_name, os.W_OK):
+            raise BalancerError("Access denied to write to file '{file_dir}'.")
+    return open(file_name, "wt")
+
+
 class LoadBalancer():
     """Reads clients loads per tick from a file and simulate the load distributes accros multiple
        servers"""
     # pylint: disable=too-many-instance-attributes
-    def __init__(self, file_in, file_out=None):
+    def __init__(self, file_in, file_out=None, metrics_file=None):
         self.file_in = None
         self.file_out = None
+        self.metrics = None
         self.ttask = 0
         self.umax = 0
         self.servers_in_use = {}
         self.tick_count = 0
         self.tick_servers_count = 0
         self.server_id_count = 0
+        self.tick_launches = 0
+        self.tick_removals = 0
         self._open_read(file_in)
         self._open_write(file_out)
+        if metrics_file is not None:
+            self.metrics = MetricsRecorder(metrics_file)
 
     def _open_read(self, file_name):
         """Checks if the input file is OK, open it and set it to self.file_in"""
@@ -36,30 +65,14 @@ class LoadBalancer():
 
     def _open_write(self, file_name):
         """Checks if the output file is OK, open it in write mode and set it to self.file_out"""
-        if file_name is None:
-            self.file_out = sys.stdout
-            return
-
-        if not (file_dir := os.path.dirname(file_name)):
-            file_dir = "./"
-        else:
-            if not os.path.isdir(file_dir):
-                raise BalancerError("Path '{file_dir}' is not a valid directory.")
-        if not os.access(file_dir, os.W_OK):
-            raise BalancerError("Access denied to write to direcoty '{file_dir}'.")
-        if os.path.isfile(file_name):
-            if not OVERWRITE_DEST_FILE:
-                raise BalancerError("Destination file already exists and can't be overwriten. "
-                                    "You can change default behavior in conf file. "
-                                    "Look for OVERWRITE_DEST_FILE.")
-        if not os.access(file_name, os.W_OK):
-            raise BalancerError("Access denied to write to file '{file_dir}'.")
-        self.file_out = open(file_name, "wt")
+        self.file_out = open_write(file_name)
 
     def _clean_up(self):
         logger.info("Closing all files...")
         self.file_in.close()
         self.file_out.close()
+        if self.metrics is not None:
+            self.metrics.close()
 
     def _test_init_limit(self, limit, value, min_value, max_value):
         if not isinstance(value, int):
@@ -75,6 +88,7 @@ class LoadBalancer():
             raise BalancerError(
                 f"Invalid number of tasks. Each server suports at most {self.umax} tasks.")
         self.server_id_count += 1
+        self.tick_launches += 1
         server_name = f"S-{self.server_id_count}"
         logger.info("Launching server %s", server_name)
         new_server = {"tasks_count": 0, "tasks": {}}
@@ -124,6 +138,7 @@ class LoadBalancer():
             raise BalancerError(f"Server {server_name} still has tasks running. Can't remove it!")
         logger.info("Remove server: %s", server_name)
         del self.servers_in_use[server_name]
+        self.tick_removals += 1
 
     def _remove_task_server(self, task_name, server_name):
         """Removes a given task from a given server."""
@@ -143,8 +158,9 @@ class LoadBalancer():
            Decrements the ticks left from each task running on each server. If the task is
            complete (0 ticks left to run) removes it. If the server has no tasks runiing
            removes it too.
+           Records this tick metrics if a metrics file was informed.
            Returns a comma separated string with tasks per server in this cicle."""
-        running_tasks_servers = [str(len(x["tasks"])) for x in self.servers_in_use.values()]
+        running_tasks_servers = [len(x["tasks"]) for x in self.servers_in_use.values()]
         self.tick_servers_count += len(running_tasks_servers)
         for server_name, server in list(self.servers_in_use.items()):
             for task in list(server["tasks"].keys()):
@@ -153,7 +169,12 @@ class LoadBalancer():
                     self._remove_task_server(task, server_name)
             if len(server["tasks"]) == 0:
                 self._remove_server(server_name)
-        return ", ".join(running_tasks_servers)
+        if self.metrics is not None:
+            self.metrics.record(len(running_tasks_servers), sum(running_tasks_servers), self.umax,
+                                self.tick_launches, self.tick_removals)
+        self.tick_launches = 0
+        self.tick_removals = 0
+        return ", ".join(map(str, running_tasks_servers))
 
     def _get_next_tick_clients(self):
         """Reads the next number in the file provided by the user."""
@@ -193,10 +214,17 @@ class LoadBalancer():
 
            Read configuration (umax and ttask) and # of new clients from a file provided by the
            user. Prints total cost when no more clients in the file and no more servers runing.
-           Writes the total cost to outfile and closes all files before exit."""
+           Writes the total cost to outfile and closes all files before exit.
+           Returns the total cost."""
         self._init_limits()
         pending_tasks = False
         while (new_clients := self._get_next_tick_clients()) or pending_tasks:
             pending_tasks = self._run_cicle(new_clients)
-        self._print_result(self.tick_servers_count * SERVER_COST)
+        return self._finish()
+
+    def _finish(self):
+        """Writes the total cost to outfile, closes all files and returns the total cost"""
+        total_cost = self.tick_servers_count * SERVER_COST
+        self._print_result(total_cost)
         self._clean_up()
+        return total_cost
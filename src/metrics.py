@@ -0,0 +1,131 @@
+"""Implements MetricsRecorder class: per tick metrics time series in columnar files"""
+from array import array
+import logging
+import os
+import struct
+import sys
+
+from src.error import BalancerError
+from src.conf import METRICS_CHUNK_SIZE
+
+
+logger = logging.getLogger(__name__)
+
+# Column name and array typecode. Each column is saved to its own "<prefix>.<name>.npy" file.
+COLUMNS = (
+    ("servers", "q"),
+    ("tasks", "q"),
+    ("utilization", "d"),
+    ("fragmentation", "d"),
+    ("launches", "q"),
+    ("removals", "q"),
+)
+
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+NPY_HEADER_SIZE = 128
+NPY_DESCR = {"q": "i8", "d": "f8"}
+BYTE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+
+def column_file(prefix, column):
+    """Returns the file name used to store a given column"""
+    return f"{prefix}.{column}.npy"
+
+
+def _npy_header(typecode, length):
+    """Builds a NumPy .npy (version 1.0) header with a fixed size of NPY_HEADER_SIZE bytes.
+
+       The fixed size allows the header to be rewritten in place with the final length once
+       all data was appended to the file."""
+    header = (f"{{'descr': '{BYTE_ORDER}{NPY_DESCR[typecode]}', 'fortran_order': False, "
+              f"'shape': ({length},), }}")
+    header_len = NPY_HEADER_SIZE - len(NPY_MAGIC) - 2
+    return NPY_MAGIC + struct.pack("<H", header_len) + header.ljust(header_len - 1).encode() + b"\n"
+
+
+def load_metrics(prefix):
+    """Reads all columns saved with a given prefix. Returns a dict of column name to array.
+
+       The files are plain .npy files and can also be memory mapped with
+       numpy.load(file_name, mmap_mode="r")."""
+    columns = {}
+    for column, typecode in COLUMNS:
+        file_name = column_file(prefix, column)
+        if not os.path.isfile(file_name):
+            raise BalancerError(f"Metrics file {file_name} not found.")
+        with open(file_name, "rb") as file_in:
+            if file_in.read(len(NPY_MAGIC)) != NPY_MAGIC:
+                raise BalancerError(f"File {file_name} is not a valid metrics file.")
+            header_len, = struct.unpack("<H", file_in.read(2))
+            file_in.seek(header_len, os.SEEK_CUR)
+            data = array(typecode)
+            data.frombytes(file_in.read())
+        columns[column] = data
+    return columns
+
+
+class MetricsRecorder():
+    """Records per tick metrics in preallocated typed arrays and flushes them in bulk to one
+       .npy file per column"""
+    def __init__(self, prefix, chunk_size=METRICS_CHUNK_SIZE):
+        self.prefix = prefix
+        self.chunk_size = chunk_size
+        self.length = 0
+        self.position = 0
+        self.buffers = {column: array(typecode, bytes(array(typecode).itemsize * chunk_size))
+                        for column, typecode in COLUMNS}
+        self.files = {}
+        self._open_files()
+
+    def _open_files(self):
+        """Checks if the metrics directory is OK and opens one file per column"""
+        if not (file_dir := os.path.dirname(self.prefix)):
+            file_dir = "./"
+        elif not os.path.isdir(file_dir):
+            raise BalancerError(f"Path '{file_dir}' is not a valid directory.")
+        if not os.access(file_dir, os.W_OK):
+            raise BalancerError(f"Access denied to write to direcoty '{file_dir}'.")
+        for column, typecode in COLUMNS:
+            self.files[column] = open(column_file(self.prefix, column), "wb")
+            self.files[column].write(_npy_header(typecode, 0))
+
+    def record(self, servers, tasks, umax, launches, removals):
+        """Records the metrics of one tick.
+
+           utilization: tasks / (servers * umax)
+           fragmentation: share of running servers a perfect packing of the tasks wouldn't need"""
+        pos = self.position
+        self.buffers["servers"][pos] = servers
+        self.buffers["tasks"][pos] = tasks
+        if servers:
+            self.buffers["utilization"][pos] = tasks / (servers * umax)
+            self.buffers["fragmentation"][pos] = (servers - -(-tasks // umax)) / servers
+        else:
+            self.buffers["utilization"][pos] = 0.0
+            self.buffers["fragmentation"][pos] = 0.0
+        self.buffers["launches"][pos] = launches
+        self.buffers["removals"][pos] = removals
+        self.position += 1
+        if self.position == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Writes all recorded ticks still in memory to the column files"""
+        if not self.position:
+            return
+        for column, buffer in self.buffers.items():
+            if self.position == self.chunk_size:
+                buffer.tofile(self.files[column])
+            else:
+                buffer[:self.position].tofile(self.files[column])
+        self.length += self.position
+        self.position = 0
+
+    def close(self):
+        """Flushes pending ticks, writes the final length to each file header and closes them"""
+        self.flush()
+        logger.info("Closing metrics files: %s ticks recorded.", self.length)
+        for column, typecode in COLUMNS:
+            self.files[column].seek(0)
+            self.files[column].write(_npy_header(typecode, self.length))
+            self.files[column].close()
@@ -0,0 +1,199 @@
+"""Sharded mode: splits the clients among many load balancers, each one with its own servers
+
+Usage: python src/shard.py INPUT_FILE SHARDS [POLICY] [OUTPUT_FILE]
+
+The new clients of each tick are routed to SHARDS LoadBalancer instances according to POLICY:
+
+    round_robin: clients are assigned to each shard in turn
+    hash: each client goes to the shard given by a hash of its id
+    least_loaded: each client goes to the shard with fewest tasks running
+
+Shards are simulated in parallel processes. Their loads are merged per tick and their costs summed.
+"""
+from collections import deque
+from itertools import zip_longest
+import logging
+from multiprocessing import Pool
+import os
+import sys
+from tempfile import TemporaryDirectory
+import zlib
+
+from src.app import setup_logging
+from src.error import BalancerError
+from src.conf import SHARD_POLICY
+from src.load_balance import LoadBalancer, open_write
+from src.trace import read_trace
+
+
+logger = logging.getLogger(__name__)
+
+
+def route_round_robin(clients, shards, _ttask):
+    """Yields the clients per shard of each tick assigning clients to each shard in turn"""
+    next_shard = 0
+    for tick_clients in clients:
+        base, rest = divmod(tick_clients, shards)
+        yield [base + ((shard - next_shard) % shards < rest) for shard in range(shards)]
+        next_shard = (next_shard + rest) % shards
+
+
+def route_hash(clients, shards, _ttask):
+    """Yields the clients per shard of each tick assigning clients by a hash of their ids"""
+    next_client_id = 0
+    for tick_clients in clients:
+        tick_shards = [0] * shards
+        for client_id in range(next_client_id, next_client_id + tick_clients):
+            tick_shards[zlib.crc32(client_id.to_bytes(8, "little")) % shards] += 1
+        next_client_id += tick_clients
+        yield tick_shards
+
+
+def route_least_loaded(clients, shards, ttask):
+    """Yields the clients per shard of each tick assigning each client to the shard with fewest
+       tasks running (lowest shard on ties)"""
+    running = [0] * shards
+    history = deque()
+    for tick_clients in clients:
+        # Tasks that arrived ttask ticks ago finished in the previous tick
+        while len(history) > ttask - 1:
+            for shard, finished in enumerate(history.popleft()):
+                running[shard] -= finished
+        tick_shards = [0] * shards
+        for _client in range(tick_clients):
+            shard = min(range(shards), key=running.__getitem__)
+            tick_shards[shard] += 1
+            running[shard] += 1
+        history.append(tick_shards)
+        yield tick_shards
+
+
+ROUTING_POLICIES = {
+    "round_robin": route_round_robin,
+    "hash": route_hash,
+    "least_loaded": route_least_loaded,
+}
+
+
+class ShardBalancer(LoadBalancer):
+    """LoadBalancer of a single shard.
+
+       A shard can have no clients for many ticks while other shards keep working, so the
+       simulation only stops at the end of its file. Writes one line per tick, empty for ticks
+       without servers running, followed by the total cost."""
+    def load_balance(self):
+        """Simulates the shard until the end of its file and no more servers running.
+           Returns the total cost."""
+        self._init_limits()
+        while (new_clients := self._get_next_tick_clients()) is not None or self.servers_in_use:
+            self.tick_count += 1
+            logger.info("Tick: %s New clients: %s", self.tick_count, new_clients)
+            if new_clients:
+                self._add_new_clients(new_clients)
+            self._print_result(self._run_tick())
+        return self._finish()
+
+
+def run_shard(in_file):
+    """Simulates a shard trace writing its result to <in_file>.out. Returns the total cost."""
+    return ShardBalancer(in_file, f"{in_file}.out").load_balance()
+
+
+def _write_shard_traces(ttask, umax, routed_ticks, work_dir, shards):
+    """Writes one trace file per shard in work_dir. Returns the list of files."""
+    shard_files = [os.path.join(work_dir, f"shard-{shard}.txt") for shard in range(shards)]
+    files = [open(file_name, "wt") for file_name in shard_files]
+    try:
+        for file_out in files:
+            file_out.write(f"{ttask}\n{umax}\n")
+        for tick_shards in routed_ticks:
+            for file_out, tick_clients in zip(files, tick_shards):
+                file_out.write(f"{tick_clients}\n")
+    finally:
+        for file_out in files:
+            file_out.close()
+    return shard_files
+
+
+def _merge_results(shard_files, file_out):
+    """Writes the loads of all shards per tick to file_out. Ticks with no servers running in any
+       shard are skipped."""
+    shard_ticks = []
+    for shard_file in shard_files:
+        with open(f"{shard_file}.out", "rt") as shard_out:
+            shard_ticks.append(shard_out.read().splitlines()[:-1])
+    for tick_loads in zip_longest(*shard_ticks, fillvalue=""):
+        if any(tick_loads):
+            file_out.write(", ".join(loads for loads in tick_loads if loads) + "\n")
+
+
+def run_sharded(in_file, shards, policy=SHARD_POLICY, out_file=None, workers=None):
+    """Routes the clients of in_file to shards LoadBalancers using a routing policy and simulates
+       them in a pool of workers processes (default: number of CPUs, at most one per shard).
+       Writes the merged loads per tick and the total cost to out_file (or sys.stdout).
+       Returns the total cost and the list of costs per shard."""
+    if shards < 1:
+        raise BalancerError("Number of shards must be greater then or equal to '1'.")
+    if policy not in ROUTING_POLICIES:
+        raise BalancerError(f"Unknown routing policy '{policy}'. "
+                            f"Options: {', '.join(ROUTING_POLICIES)}.")
+    ttask, umax, clients = read_trace(in_file)
+    # Checked before the simulation, which can take long, with the same rules of LoadBalancer
+    file_out = open_write(out_file)
+    try:
+        logger.info("Routing %s ticks to %s shards using %s", len(clients), shards, policy)
+        routed_ticks = ROUTING_POLICIES[policy](clients, shards, ttask)
+        with TemporaryDirectory() as work_dir:
+            shard_files = _write_shard_traces(ttask, umax, routed_ticks, work_dir, shards)
+            with Pool(min(workers or os.cpu_count() or 1, shards),
+                      initializer=setup_logging) as pool:
+                shard_costs = pool.map(run_shard, shard_files, chunksize=1)
+            total_cost = sum(shard_costs)
+            _merge_results(shard_files, file_out)
+            file_out.write(f"{total_cost}\n")
+    finally:
+        if out_file is not None:
+            file_out.close()
+    return total_cost, shard_costs
+
+
+def usage():
+    "Prints how to use this program and exits with error."
+    print(f"USAGE: shard INPUT_FILE SHARDS [{'|'.join(ROUTING_POLICIES)}] [OUTPUT_FILE]")
+    sys.exit(1)
+
+
+def validate_parameters():
+    """Validates the paramters used to call the app"""
+    param_count = len(sys.argv)
+    if param_count < 3 or param_count > 5:
+        usage()
+    if not sys.argv[2].isdigit() or int(sys.argv[2]) < 1:
+        print("SHARDS must be a positive integer.")
+        usage()
+    policy = sys.argv[3] if param_count >= 4 else SHARD_POLICY
+    if policy not in ROUTING_POLICIES:
+        print(f"Unknown routing policy '{policy}'.")
+        usage()
+    out_file = sys.argv[4] if param_count == 5 else None
+    return sys.argv[1], int(sys.argv[2]), policy, out_file
+
+
+def main():
+    """Sharded app function. Simulates the input file in shards"""
+    in_file, shards, policy, out_file = validate_parameters()
+    setup_logging()
+    # pylint: disable=broad-except
+    # pylint: disable=invalid-name
+    try:
+        run_sharded(in_file, shards, policy, out_file)
+    except BalancerError as e:
+        logger.error(e)
+        print(e)
+    except Exception:
+        logger.exception("System failure - unpredicted error")
+        print("Internal failure, please check the logs for more detail.")
+
+
+if __name__ == "__main__":
+    main()
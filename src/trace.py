@@ -0,0 +1,62 @@
+"""Reads clients traces with the same rules used by LoadBalancer"""
+import os
+
+from src.error import BalancerError
+from src.conf import TTASK_MIN, TTASK_MAX, UMAX_MIN, UMAX_MAX
+
+
+def _read_limit(file_in, limit, min_value, max_value):
+    """Reads and validates a configuration value (ttask or umax)"""
+    try:
+        value = int(file_in.readline())
+    except ValueError as e:
+        raise BalancerError("Value must be an integer.") from e
+    if value < min_value:
+        raise BalancerError(f"{limit} must be greater then or equal to '{min_value}'.")
+    if value > max_value:
+        raise BalancerError(f"{limit} must be lesser then or equal to '{max_value}'.")
+    return value
+
+
+def read_limits(file_in):
+    """Reads ttask and umax from the first two lines of an open trace file"""
+    ttask = _read_limit(file_in, "ttask", TTASK_MIN, TTASK_MAX)
+    umax = _read_limit(file_in, "umax", UMAX_MIN, UMAX_MAX)
+    return ttask, umax
+
+
+def iter_clients(file_in, ttask):
+    """Yields the number of new clients per tick the same way LoadBalancer reads them.
+
+       A line that isn't an integer is a tick without new clients (0). A tick without new
+       clients ends the trace if no task was running in the previous tick: this happens for a
+       leading 0 or after more than ttask consecutive zeros."""
+    zero_run = 0
+    first = True
+    for line in file_in:
+        try:
+            clients = int(line)
+        except ValueError:
+            clients = 0
+        if clients:
+            zero_run = 0
+        else:
+            zero_run += 1
+            if first or zero_run > ttask:
+                return
+        first = False
+        yield clients
+
+
+def open_trace(file_name):
+    """Checks if the trace file exists and opens it"""
+    if not os.path.isfile(file_name):
+        raise BalancerError(f"Input file {file_name} not found.")
+    return open(file_name, "rt")
+
+
+def read_trace(file_name):
+    """Reads a trace file. Returns ttask, umax and a list with new clients per tick."""
+    with open_trace(file_name) as file_in:
+        ttask, umax = read_limits(file_in)
+        return ttask, umax, list(iter_clients(file_in, ttask))
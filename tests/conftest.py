@@ -0,0 +1,20 @@
+"""Shared pytest configuration"""
+import os
+
+from hypothesis import settings, HealthCheck
+from pytest import fixture, MonkeyPatch
+
+settings.register_profile("default", max_examples=50, deadline=None,
+                          suppress_health_check=[HealthCheck.too_slow])
+settings.register_profile("ci", max_examples=1000, deadline=None,
+                          suppress_health_check=[HealthCheck.too_slow])
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "default"))
+
+
+@fixture(autouse=True, scope="session")
+def log_file(tmp_path_factory):
+    """Keeps the log of the tests (including pool workers) out of the working directory"""
+    with MonkeyPatch.context() as patch:
+        log_path = str(tmp_path_factory.mktemp("logs") / "balancer.log")
+        patch.setattr("src.app.LOG_FILE", log_path)
+        yield log_path
@@ -0,0 +1,58 @@
+"""Trace strategies and engine runners shared by the property based tests"""
+import os
+
+from hypothesis import strategies as st
+
+from src.conf import UMAX_MIN, UMAX_MAX
+from src.load_balance import LoadBalancer
+from src.metrics import load_metrics
+
+
+# Lines that aren't integers are read as ticks without new clients
+NOT_INTEGER_LINES = st.sampled_from(["", "x"])
+
+
+def adversarial_clients(umax, ttask):
+    """Clients per tick around the multiples of umax, in bursts separated by idle gaps made of
+       zeros and lines that aren't integers"""
+    edge_values = st.sampled_from(sorted({1, max(umax - 1, 1), umax, umax + 1, 2 * umax - 1,
+                                          2 * umax, 3 * umax + 1}))
+    gaps = st.lists(st.one_of(st.just(0), NOT_INTEGER_LINES), max_size=ttask + 2)
+    bursts = st.tuples(st.lists(edge_values, min_size=1, max_size=ttask + 2), gaps)
+    return st.lists(bursts, max_size=8).map(
+        lambda items: [clients for burst, gap in items for clients in burst + gap])
+
+
+@st.composite
+def traces(draw, ttask):
+    """Generates (ttask, umax, clients per tick) traces. Clients per tick can also be a line
+       that isn't an integer."""
+    umax = draw(st.integers(UMAX_MIN, UMAX_MAX))
+    clients = draw(st.one_of(
+        st.lists(st.integers(0, 3 * umax), max_size=60),
+        st.lists(st.one_of(st.integers(1, 3 * umax), NOT_INTEGER_LINES), max_size=60),
+        adversarial_clients(umax, ttask),
+    ))
+    return ttask, umax, clients
+
+
+def run_metrics(in_file, out_file, work_dir):
+    """LoadBalancer recording metrics to <work_dir>/metrics. The metrics must also agree with the
+       total cost."""
+    prefix = os.path.join(work_dir, "metrics")
+    lb = LoadBalancer(in_file, out_file, prefix)
+    lb.load_balance()
+    assert sum(load_metrics(prefix)["servers"]) == lb.tick_servers_count
+
+
+def run_engine(engine, trace, work_dir):
+    """Writes the trace to work_dir, runs the engine on it and returns its output lines"""
+    ttask, umax, clients = trace
+    in_file = os.path.join(work_dir, f"{engine.__name__}.in")
+    out_file = os.path.join(work_dir, f"{engine.__name__}.out")
+    with open(in_file, "wt") as file_in:
+        file_in.write("".join(f"{value}\n" for value in [ttask, umax] + clients))
+    open(out_file, "wt").close()
+    engine(in_file, out_file, work_dir)
+    with open(out_file, "rt") as file_out:
+        return file_out.read().splitlines()
@@ -26,24 +26,60 @@ def test_usage_docker(mocker):
 
 def test_validate_parameters_input_only(mocker):
     mocker.patch("sys.argv", ["python", "clients.txt"])
-    ret1, ret2 = validate_parameters()
+    ret1, ret2, ret3 = validate_parameters()
     assert ret1 == "clients.txt"
     assert ret2 is None
+    assert ret3 is None
 
 
 def test_validate_parameters_input_output(mocker):
     mocker.patch("sys.argv", ["python", "clients.txt", "results.txt"])
-    ret1, ret2 = validate_parameters()
+    ret1, ret2, ret3 = validate_parameters()
     assert ret1 == "clients.txt"
     assert ret2 == "results.txt"
+    assert ret3 is None
+
+
+def test_validate_parameters_input_output_metrics(mocker):
+    mocker.patch("sys.argv", ["python", "clients.txt", "results.txt", "metrics"])
+    ret1, ret2, ret3 = validate_parameters()
+    assert ret1 == "clients.txt"
+    assert ret2 == "results.txt"
+    assert ret3 == "metrics"
+
+
+def test_validate_parameters_stdout_metrics(mocker):
+    mocker.patch("sys.argv", ["python", "clients.txt", "-", "metrics"])
+    ret1, ret2, ret3 = validate_parameters()
+    assert ret1 == "clients.txt"
+    assert ret2 is None
+    assert ret3 == "metrics"
+
+
+def test_validate_parameters_stdout_metrics_docker(mocker):
+    mocker.patch("sys.argv", ["python", "clients.txt", "-", "metrics"])
+    mocker.patch("src.app.environ", {"DOCKER": "True"})
+    mocker_usage = mocker.patch("src.app.usage")
+    assert validate_parameters() == ("clients.txt", None, "metrics")
+    assert mocker_usage.call_count == 0
+
+
+def test_validate_parameters_output_docker(mocker):
+    mocker.patch("sys.argv", ["python", "clients.txt", "results.txt"])
+    mocker.patch("src.app.environ", {"DOCKER": "True"})
+    mocker.patch("builtins.print")
+    mocker_usage = mocker.patch("src.app.usage")
+    validate_parameters()
+    assert mocker_usage.call_count == 1
 
 
 def test_validate_parameters_input_only_docker(mocker):
     mocker.patch("sys.argv", ["python", "clients.txt"])
     mocker.patch.dict(os.environ, {"DOCKER": "True"})  # Not working in real life
-    ret1, ret2 = validate_parameters()
+    ret1, ret2, ret3 = validate_parameters()
     assert ret1 == "clients.txt"
     assert ret2 is None
+    assert ret3 is None
 
 
 # BUG: can not patch os.environ!!!
@@ -62,7 +98,7 @@ def test_validate_parameters_input_only_docker(mocker):
 
 def test_main(mocker):
     mocker_validate_parameters = mocker.patch(
-        "src.app.validate_parameters", return_value=("file1", None))
+        "src.app.validate_parameters", return_value=("file1", None, None))
     mocker_load_balacer = mocker.patch("src.load_balance.LoadBalancer.__init__", return_value=None)
     mocker_load_balacer_load_balance = mocker.patch("src.load_balance.LoadBalancer.load_balance")
     main()
@@ -73,7 +109,7 @@ def test_main(mocker):
 
 def test_main_predicted_error(mocker):
     mocker_validate_parameters = mocker.patch(
-        "src.app.validate_parameters", return_value=("file1", None))
+        "src.app.validate_parameters", return_value=("file1", None, None))
     mocker_load_balacer = mocker.patch(
         "src.load_balance.LoadBalancer.__init__", return_value=None)
     mocker_load_balacer_load_balance = mocker.patch(
@@ -90,7 +126,7 @@ def test_main_predicted_error(mocker):
 
 def test_main_unpredicted_error(mocker):
     mocker_validate_parameters = mocker.patch(
-        "src.app.validate_parameters", return_value=("file1", None))
+        "src.app.validate_parameters", return_value=("file1", None, None))
     mocker_load_balacer = mocker.patch(
         "src.load_balance.LoadBalancer.__init__", return_value=None)
     mocker_load_balacer_load_balance = mocker.patch(
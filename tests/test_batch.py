@@ -0,0 +1,117 @@
+"""Tests for src.batch.py"""
+import csv
+import os
+
+from pytest import fixture, raises
+
+from src.batch import find_traces, simulate, run_batch, validate_parameters
+from src.conf import BATCH_SUMMARY_FILE
+from src.error import BalancerError
+
+INPUT_FILE = "tests/input_test.txt"
+
+
+@fixture
+def traces_dir(tmp_path):
+    """Fixture with a directory containing two valid traces and an invalid one"""
+    in_dir = tmp_path / "in"
+    in_dir.mkdir()
+    with open(INPUT_FILE, "rt") as file_in:
+        trace = file_in.read()
+    (in_dir / "a.txt").write_text(trace)
+    (in_dir / "b.txt").write_text(trace + "5\n")
+    (in_dir / "c.dat").write_text("4\n20\n1\n")
+    return in_dir
+
+
+@fixture
+def out_dir(tmp_path):
+    """Fixture with an empty output directory"""
+    path = tmp_path / "out"
+    path.mkdir()
+    return path
+
+
+def test_find_traces_dir(traces_dir):
+    assert find_traces(str(traces_dir)) == [
+        str(traces_dir / "a.txt"), str(traces_dir / "b.txt"), str(traces_dir / "c.dat")]
+
+
+def test_find_traces_glob(traces_dir):
+    assert find_traces(str(traces_dir / "*.txt")) == [
+        str(traces_dir / "a.txt"), str(traces_dir / "b.txt")]
+
+
+def test_find_traces_manifest(traces_dir):
+    (traces_dir / "manifest").write_text("b.txt\n\na.txt\n")
+    assert find_traces(str(traces_dir / "manifest")) == [
+        str(traces_dir / "b.txt"), str(traces_dir / "a.txt")]
+
+
+def test_find_traces_not_found(traces_dir):
+    with raises(BalancerError) as e:
+        find_traces(str(traces_dir / "*.csv"))
+    assert "No input files found" in str(e)
+
+
+def test_simulate(traces_dir, out_dir):
+    out_file = str(out_dir / "a.txt.out")
+    assert simulate((str(traces_dir / "a.txt"), out_file)) == (
+        str(traces_dir / "a.txt"), 10, 15.0, None)
+    with open(out_file, "rt") as file_out:
+        assert file_out.read().splitlines()[-1] == "15.0"
+
+
+def test_simulate_error(traces_dir, out_dir):
+    in_file = str(traces_dir / "c.dat")
+    assert simulate((in_file, str(out_dir / "c.dat.out"))) == (
+        in_file, None, None, "umax must be lesser then or equal to '10'.")
+
+
+def test_run_batch(traces_dir, out_dir):
+    results, total_cost = run_batch(str(traces_dir), str(out_dir), workers=2)
+    assert [result[2] for result in results] == [15.0, 27.0, None]
+    assert total_cost == 42.0
+    assert sorted(os.listdir(out_dir)) == [
+        "a.txt.out", "b.txt.out", "c.dat.out", BATCH_SUMMARY_FILE]
+    with open(out_dir / BATCH_SUMMARY_FILE, "rt") as summary:
+        rows = list(csv.reader(summary))
+    assert rows[0] == ["input_file", "ticks", "cost", "error"]
+    assert rows[-1] == ["TOTAL", "", "42.0", ""]
+
+
+def test_run_batch_missing_manifest_entry(traces_dir, out_dir):
+    (traces_dir / "manifest").write_text("a.txt\nmissing.txt\n")
+    results, total_cost = run_batch(str(traces_dir / "manifest"), str(out_dir), workers=1)
+    assert total_cost == 15.0
+    assert results[1][0] == str(traces_dir / "missing.txt")
+    assert "not found" in results[1][3]
+    assert (out_dir / BATCH_SUMMARY_FILE).is_file()
+
+
+def test_run_batch_invalid_out_dir(traces_dir):
+    with raises(BalancerError) as e:
+        run_batch(str(traces_dir), "dont_exist")
+    assert "not a valid directory" in str(e)
+
+
+def test_run_batch_duplicated_names(traces_dir, out_dir, tmp_path):
+    (tmp_path / "manifest").write_text("in/a.txt\nin/../in/a.txt\n")
+    with raises(BalancerError) as e:
+        run_batch(str(tmp_path / "manifest"), str(out_dir))
+    assert "More than one input file" in str(e)
+
+
+def test_validate_parameters(mocker):
+    mocker.patch("sys.argv", ["python", "traces/", "results/", "4"])
+    assert validate_parameters() == ("traces/", "results/", 4)
+
+
+def test_validate_parameters_invalid_workers(mocker):
+    mocker.patch("sys.argv", ["python", "traces/", "results/", "0"])
+    mocker_print = mocker.patch("builtins.print")
+    mocker_sys_exit = mocker.patch("sys.exit", side_effect=SystemExit)
+    with raises(SystemExit):
+        validate_parameters()
+    assert mocker_print.call_count == 2
+    assert mocker_sys_exit.call_count == 1
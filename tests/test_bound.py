@@ -0,0 +1,93 @@
+"""Tests for src.bound.py"""
+from itertools import zip_longest
+import os
+from tempfile import TemporaryDirectory
+
+from hypothesis import given, strategies as st
+from pytest import fixture, raises
+
+from src.bound import tick_lower_bounds, lower_bound, efficiency_report
+from src.error import BalancerError
+from src.load_balance import LoadBalancer
+from src.metrics import load_metrics
+from src.trace import iter_clients
+from tests.helpers import traces, run_engine, run_metrics
+
+INPUT_FILE = "tests/input_test.txt"
+
+
+@fixture
+def metrics_file(tmp_path):
+    """Fixture with the metrics of a simulation of INPUT_FILE"""
+    out_file = tmp_path / "out.txt"
+    out_file.touch()
+    prefix = str(tmp_path / "metrics")
+    LoadBalancer(INPUT_FILE, str(out_file), prefix).load_balance()
+    return prefix
+
+
+def test_tick_lower_bounds():
+    assert list(tick_lower_bounds(2, 3, [4, 0, 3])) == [2, 2, 1, 1]
+
+
+def test_tick_lower_bounds_ttask_one():
+    assert list(tick_lower_bounds(1, 2, [4, 3, 0, 1])) == [2, 2, 0, 1]
+
+
+def test_tick_lower_bounds_empty():
+    assert list(tick_lower_bounds(3, 2, [])) == [0, 0]
+
+
+def test_lower_bound():
+    assert lower_bound(INPUT_FILE) == 14.0
+
+
+def test_lower_bound_not_integer_line(tmp_path):
+    in_file = tmp_path / "trace.txt"
+    in_file.write_text("4\n2\n1\n\n3\n")
+    assert lower_bound(str(in_file)) == 10.0
+    assert efficiency_report(str(in_file))["cost"] == 10.0
+
+
+def test_lower_bound_not_found():
+    with raises(BalancerError) as e:
+        lower_bound("tests/dont_exist.txt")
+    assert "not found" in str(e)
+
+
+def test_efficiency_report_not_found():
+    with raises(BalancerError) as e:
+        efficiency_report("tests/dont_exist.txt")
+    assert "not found" in str(e)
+
+
+def test_efficiency_report():
+    report = efficiency_report(INPUT_FILE)
+    assert report["cost"] == 15.0
+    assert report["lower_bound"] == 14.0
+    assert report["efficiency"] == 14.0 / 15.0
+    assert report["hotspots"] == [(5, 3, 2)]
+
+
+def test_efficiency_report_metrics_file(metrics_file, mocker):
+    mocker_simulate_servers = mocker.patch("src.bound._simulate_servers")
+    report = efficiency_report(INPUT_FILE, metrics_file, top=0)
+    assert mocker_simulate_servers.call_count == 0
+    assert report["cost"] == 15.0
+    assert report["hotspots"] == []
+
+
+@given(data=st.data())
+def test_bound_matches_simulated_tasks(data):
+    ttask, umax, clients = data.draw(traces(data.draw(st.integers(1, 10))))
+    with TemporaryDirectory() as work_dir:
+        run_engine(run_metrics, (ttask, umax, clients), work_dir)
+        columns = load_metrics(os.path.join(work_dir, "metrics"))
+    trace = list(iter_clients(map(str, clients), ttask))
+    # umax=1 turns the bound into the live tasks per tick
+    live_tasks = tick_lower_bounds(ttask, 1, trace)
+    bounds = tick_lower_bounds(ttask, umax, trace)
+    assert all(tasks == live for tasks, live in
+               zip_longest(columns["tasks"], live_tasks, fillvalue=0))
+    assert all(servers >= bound for servers, bound in
+               zip_longest(columns["servers"], bounds, fillvalue=0))
@@ -0,0 +1,114 @@
+"""Tests for src.daemon.py and src.client.py"""
+import socket
+import threading
+
+from pytest import fixture, raises
+
+from src.client import request, main as client_main
+from src.daemon import BalancerServer
+from src.error import BalancerError
+
+INPUT_FILE = "tests/input_test.txt"
+
+
+@fixture
+def socket_path(tmp_path):
+    """Fixture with a socket path inside a temporary directory"""
+    return str(tmp_path / "balancer.sock")
+
+
+@fixture
+def server(socket_path):
+    """Fixture with a daemon serving requests in a thread"""
+    server = BalancerServer(socket_path, workers=1)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+def test_request(server):
+    cost, text = request(server.path, INPUT_FILE)
+    assert cost == 15.0
+    assert text.splitlines()[:2] == ["1", "2, 2"]
+    assert text.splitlines()[-1] == "15.0"
+
+
+def test_request_output_file(server, tmp_path):
+    out_file = tmp_path / "out.txt"
+    assert request(server.path, INPUT_FILE, str(out_file)) == (15.0, "")
+    assert out_file.read_text().splitlines()[-1] == "15.0"
+
+
+def test_request_error(server):
+    cost, text = request(server.path, "tests/dont_exist.txt")
+    assert cost is None
+    assert "not found" in text
+
+
+def test_invalid_request(server):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(server.path)
+        sock.sendall(b"no tab here\n")
+        assert sock.makefile("r").readline() == "ERROR\tInvalid request.\n"
+
+
+def test_daemon_already_running(server):
+    with raises(BalancerError) as e:
+        BalancerServer(server.path)
+    assert "already running" in str(e)
+
+
+def test_stale_socket(socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(socket_path)
+    server = BalancerServer(socket_path, workers=1)
+    server.server_close()
+
+
+def test_request_no_response(server, mocker):
+    mocker.patch.object(server, "run", side_effect=ValueError("BUG!"))
+    cost, text = request(server.path, INPUT_FILE)
+    assert cost is None
+    assert "Invalid response from the daemon" in text
+
+
+def test_socket_path_not_a_socket(tmp_path):
+    regular_file = tmp_path / "data.txt"
+    regular_file.write_text("user data")
+    with raises(BalancerError) as e:
+        BalancerServer(str(regular_file), workers=1)
+    assert "is not a socket" in str(e)
+    assert regular_file.read_text() == "user data"
+
+
+def test_socket_path_invalid_dir(tmp_path):
+    with raises(BalancerError) as e:
+        BalancerServer(str(tmp_path / "dont_exist" / "balancer.sock"), workers=1)
+    assert "Can't use socket" in str(e)
+
+
+def test_client_daemon_not_running(socket_path, mocker):
+    mocker.patch("sys.argv", ["python", INPUT_FILE])
+    mocker.patch.dict("os.environ", {"BALANCER_SOCKET": socket_path})
+    mocker_print = mocker.patch("builtins.print")
+    with raises(SystemExit):
+        client_main()
+    assert "Daemon not running" in mocker_print.call_args[0][0]
+
+
+def test_client_permission_denied(socket_path, mocker):
+    mocker.patch("sys.argv", ["python", INPUT_FILE])
+    mocker.patch.dict("os.environ", {"BALANCER_SOCKET": socket_path})
+    mocker.patch("src.client.request", side_effect=PermissionError(13, "Permission denied"))
+    mocker_print = mocker.patch("builtins.print")
+    with raises(SystemExit):
+        client_main()
+    assert "Permission denied" in mocker_print.call_args[0][0]
+
+
+def test_daemon_not_running(socket_path):
+    with raises(FileNotFoundError):
+        request(socket_path, INPUT_FILE)
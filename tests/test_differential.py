@@ -0,0 +1,60 @@
+"""Differential tests: compares alternative engines against the reference LoadBalancer.
+
+The reference LoadBalancer is the oracle. Each engine in ENGINES runs the same random or
+adversarial traces and must produce the same per tick output and total cost. Hypothesis shrinks
+any failing trace to a minimal repro, printed with the failure.
+
+Run more cases in parallel with: HYPOTHESIS_PROFILE=ci pytest -n auto tests/test_differential.py
+"""
+import os
+import shutil
+from tempfile import TemporaryDirectory
+
+from hypothesis import given, note, strategies as st
+from pytest import mark
+
+from src.batch import run_batch
+from src.conf import TTASK_MIN, TTASK_MAX
+from src.load_balance import LoadBalancer
+from src.shard import run_sharded
+from tests.helpers import traces, run_engine, run_metrics
+
+
+def run_reference(in_file, out_file, _work_dir):
+    """Oracle: the reference LoadBalancer"""
+    LoadBalancer(in_file, out_file).load_balance()
+
+
+def run_batch_mode(in_file, out_file, work_dir):
+    """Batch mode with a directory containing a single input file"""
+    in_dir, out_dir = os.path.join(work_dir, "batch_in"), os.path.join(work_dir, "batch_out")
+    os.mkdir(in_dir)
+    os.mkdir(out_dir)
+    shutil.copy(in_file, in_dir)
+    run_batch(in_dir, out_dir, workers=1)
+    shutil.copyfile(os.path.join(out_dir, f"{os.path.basename(in_file)}.out"), out_file)
+
+
+def run_single_shard(in_file, out_file, _work_dir):
+    """Sharded mode with a single shard"""
+    run_sharded(in_file, 1, out_file=out_file)
+
+
+ENGINES = {
+    "metrics": run_metrics,
+    "batch": run_batch_mode,
+    "single_shard": run_single_shard,
+}
+
+
+@mark.parametrize("engine", ENGINES.values(), ids=ENGINES.keys())
+@mark.parametrize("ttask", range(TTASK_MIN, TTASK_MAX + 1))
+@given(data=st.data())
+def test_engine_matches_reference(engine, ttask, data):
+    trace = data.draw(traces(ttask), label="trace")
+    note(f"ttask={trace[0]} umax={trace[1]} clients={trace[2]}")
+    with TemporaryDirectory() as work_dir:
+        expected = run_engine(run_reference, trace, work_dir)
+        result = run_engine(engine, trace, work_dir)
+    assert result[:-1] == expected[:-1], "Per tick output differs"
+    assert float(result[-1]) == float(expected[-1]), "Total cost differs"
@@ -109,6 +109,12 @@ def test_open_existing_write_file_no_overwrite(lb, mocker):
     assert "can't be overwriten" in str(e)
 
 
+def test_open_new_write_file(lb, tmp_path):
+    out_file = str(tmp_path / "new_out.txt")
+    lb._open_write(out_file)
+    assert lb.file_out.name == out_file
+
+
 def test_open_existing_write_file_access_denied_dir(lb, access_denied_dir):
     with raises(BalancerError) as e:
         lb._open_write(f"{access_denied_dir}/out.txt")
@@ -393,7 +399,8 @@ def test_load_balance(lb, mocker):
     mocker_run_cicle = mocker.patch.object(lb, "_run_cicle", side_effect=[True, False])
     mocker_print_result = mocker.patch.object(lb, "_print_result")
     mocker_clean_up = mocker.patch.object(lb, "_clean_up")
-    lb.load_balance()
+    ret = lb.load_balance()
+    assert ret == 0
     assert mocker_init_limits.call_count == 1
     assert mocker_get_next_tick_clients.call_count == 3
     assert mocker_run_cicle.call_count == 2
@@ -0,0 +1,98 @@
+"""Tests MetricsRecorder class"""
+from pytest import fixture, raises
+
+from src.error import BalancerError
+from src.load_balance import LoadBalancer
+from src.metrics import MetricsRecorder, COLUMNS, NPY_MAGIC, NPY_HEADER_SIZE, column_file, \
+    load_metrics
+
+INPUT_FILE = "tests/input_test.txt"
+
+
+@fixture
+def prefix(tmp_path):
+    """Fixture with a metrics prefix inside a temporary directory"""
+    return str(tmp_path / "metrics")
+
+
+def test_instance(prefix):
+    metrics = MetricsRecorder(prefix, chunk_size=4)
+    assert metrics.length == 0
+    assert metrics.position == 0
+    assert len(metrics.buffers) == len(COLUMNS)
+    assert all(len(buffer) == 4 for buffer in metrics.buffers.values())
+    metrics.close()
+
+
+def test_instance_invalid_dir():
+    with raises(BalancerError) as e:
+        MetricsRecorder("dont_exist/metrics")
+    assert "not a valid directory" in str(e)
+
+
+def test_record(prefix):
+    metrics = MetricsRecorder(prefix, chunk_size=4)
+    metrics.record(servers=3, tasks=4, umax=2, launches=1, removals=0)
+    assert metrics.position == 1
+    assert metrics.buffers["servers"][0] == 3
+    assert metrics.buffers["tasks"][0] == 4
+    assert metrics.buffers["utilization"][0] == 4 / 6
+    assert metrics.buffers["fragmentation"][0] == 1 / 3
+    assert metrics.buffers["launches"][0] == 1
+    assert metrics.buffers["removals"][0] == 0
+    metrics.close()
+
+
+def test_record_no_servers(prefix):
+    metrics = MetricsRecorder(prefix, chunk_size=4)
+    metrics.record(servers=0, tasks=0, umax=2, launches=0, removals=1)
+    assert metrics.buffers["utilization"][0] == 0.0
+    assert metrics.buffers["fragmentation"][0] == 0.0
+    metrics.close()
+
+
+def test_record_flush_full_chunk(prefix, mocker):
+    metrics = MetricsRecorder(prefix, chunk_size=2)
+    spy_flush = mocker.spy(metrics, "flush")
+    metrics.record(1, 1, 2, 1, 0)
+    assert spy_flush.call_count == 0
+    metrics.record(1, 2, 2, 0, 0)
+    assert spy_flush.call_count == 1
+    assert metrics.length == 2
+    assert metrics.position == 0
+    metrics.close()
+
+
+def test_close_load_metrics(prefix):
+    metrics = MetricsRecorder(prefix, chunk_size=2)
+    for tick in range(5):
+        metrics.record(tick, tick * 2, 2, tick, 0)
+    metrics.close()
+    with open(column_file(prefix, "servers"), "rb") as file_in:
+        header = file_in.read(NPY_HEADER_SIZE)
+    assert header.startswith(NPY_MAGIC)
+    assert b"'shape': (5,)" in header
+    assert header.endswith(b"\n")
+    columns = load_metrics(prefix)
+    assert list(columns["servers"]) == [0, 1, 2, 3, 4]
+    assert list(columns["tasks"]) == [0, 2, 4, 6, 8]
+    assert list(columns["utilization"]) == [0.0, 1.0, 1.0, 1.0, 1.0]
+
+
+def test_load_metrics_not_found(prefix):
+    with raises(BalancerError) as e:
+        load_metrics(prefix)
+    assert "not found" in str(e)
+
+
+def test_load_balance_metrics(prefix, tmp_path):
+    out_file = tmp_path / "out.txt"
+    out_file.touch()
+    lb = LoadBalancer(INPUT_FILE, str(out_file), prefix)
+    lb.load_balance()
+    columns = load_metrics(prefix)
+    assert list(columns["servers"]) == [1, 2, 2, 3, 3, 1, 1, 1, 1, 0]
+    assert list(columns["tasks"]) == [1, 4, 4, 5, 4, 2, 2, 1, 1, 0]
+    assert list(columns["launches"]) == [1, 1, 0, 1, 0, 0, 0, 0, 0, 0]
+    assert list(columns["removals"]) == [0, 0, 0, 0, 2, 0, 0, 0, 1, 0]
+    assert sum(columns["servers"]) == lb.tick_servers_count
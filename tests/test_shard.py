@@ -0,0 +1,120 @@
+"""Tests for src.shard.py"""
+from hypothesis import given, strategies as st
+from pytest import fixture, mark, raises
+
+import src.shard
+from src.error import BalancerError
+from src.shard import route_round_robin, route_hash, route_least_loaded, ROUTING_POLICIES, \
+    ShardBalancer, run_sharded, validate_parameters
+
+INPUT_FILE = "tests/input_test.txt"
+
+
+@fixture
+def out_file(tmp_path):
+    """Fixture with an output file path inside a temporary directory"""
+    return str(tmp_path / "out.txt")
+
+
+def test_route_round_robin():
+    assert list(route_round_robin([1, 3, 0, 2], 3, 4)) == [
+        [1, 0, 0], [1, 1, 1], [0, 0, 0], [0, 1, 1]]
+
+
+def test_route_hash():
+    routed = list(route_hash([1, 3, 0, 2], 3, 4))
+    assert [sum(tick) for tick in routed] == [1, 3, 0, 2]
+    assert routed == list(route_hash([1, 3, 0, 2], 3, 4))
+
+
+def test_route_least_loaded():
+    assert list(route_least_loaded([1, 3, 0, 1, 2], 2, 2)) == [
+        [1, 0], [1, 2], [0, 0], [1, 0], [1, 1]]
+
+
+@mark.parametrize("policy", ROUTING_POLICIES.values(), ids=ROUTING_POLICIES.keys())
+@given(clients=st.lists(st.integers(0, 30), max_size=30), shards=st.integers(1, 5),
+       ttask=st.integers(1, 10))
+def test_route_keeps_all_clients(policy, clients, shards, ttask):
+    routed = list(policy(clients, shards, ttask))
+    assert [sum(tick) for tick in routed] == clients
+    assert all(len(tick) == shards for tick in routed)
+
+
+def test_shard_balancer_idle_ticks(tmp_path, out_file):
+    in_file = tmp_path / "shard.txt"
+    in_file.write_text("1\n2\n0\n0\n0\n3\n")
+    assert ShardBalancer(str(in_file), out_file).load_balance() == 2.0
+    with open(out_file, "rt") as file_out:
+        assert file_out.read().splitlines() == ["", "", "", "2, 1", "2.0"]
+
+
+def test_run_sharded(out_file):
+    total_cost, shard_costs = run_sharded(INPUT_FILE, 1, "round_robin", out_file)
+    assert total_cost == 15.0
+    assert shard_costs == [15.0]
+    with open(out_file, "rt") as file_out:
+        lines = file_out.read().splitlines()
+    assert lines[:3] == ["1", "2, 2", "2, 2"]
+    assert lines[-1] == "15.0"
+
+
+def test_run_sharded_not_integer_line(tmp_path, out_file):
+    in_file = tmp_path / "trace.txt"
+    in_file.write_text("4\n2\n1\n\n3\n")
+    assert run_sharded(str(in_file), 1, out_file=out_file)[0] == 10.0
+    with open(out_file, "rt") as file_out:
+        assert file_out.read().splitlines() == ["1", "1", "2, 2", "2, 2", "1, 2", "1, 2", "10.0"]
+
+
+def test_run_sharded_many_shards(out_file):
+    total_cost, shard_costs = run_sharded(INPUT_FILE, 3, "round_robin", out_file, workers=2)
+    assert total_cost == sum(shard_costs) == 19.0
+    with open(out_file, "rt") as file_out:
+        lines = file_out.read().splitlines()
+    assert lines[:4] == ["1", "2, 1, 1", "2, 1, 1", "2, 2, 1"]
+
+
+def test_run_sharded_default_workers(out_file, mocker):
+    mocker.patch("os.cpu_count", return_value=2)
+    spy_pool = mocker.spy(src.shard, "Pool")
+    run_sharded(INPUT_FILE, 8, "round_robin", out_file)
+    assert spy_pool.call_args[0][0] == 2
+
+
+def test_run_sharded_invalid_policy():
+    with raises(BalancerError) as e:
+        run_sharded(INPUT_FILE, 2, "random")
+    assert "Unknown routing policy" in str(e)
+
+
+def test_run_sharded_invalid_shards():
+    with raises(BalancerError) as e:
+        run_sharded(INPUT_FILE, 0)
+    assert "Number of shards" in str(e)
+
+
+def test_validate_parameters(mocker):
+    mocker.patch("sys.argv", ["python", "clients.txt", "4", "hash", "results.txt"])
+    assert validate_parameters() == ("clients.txt", 4, "hash", "results.txt")
+
+
+def test_validate_parameters_default_policy(mocker):
+    mocker.patch("sys.argv", ["python", "clients.txt", "2"])
+    assert validate_parameters() == ("clients.txt", 2, "round_robin", None)
+
+
+def test_run_sharded_no_overwrite(out_file, mocker):
+    mocker.patch("src.load_balance.OVERWRITE_DEST_FILE", False)
+    open(out_file, "wt").close()
+    spy_pool = mocker.spy(src.shard, "Pool")
+    with raises(BalancerError) as e:
+        run_sharded(INPUT_FILE, 2, out_file=out_file)
+    assert "can't be overwriten" in str(e)
+    spy_pool.assert_not_called()
+
+
+def test_run_sharded_invalid_out_dir(tmp_path):
+    with raises(BalancerError) as e:
+        run_sharded(INPUT_FILE, 2, out_file=str(tmp_path / "dont_exist" / "out.txt"))
+    assert "not a valid directory" in str(e)
@@ -0,0 +1,49 @@
+"""Tests for src.trace.py"""
+import io
+
+from pytest import raises
+
+from src.error import BalancerError
+from src.trace import read_limits, iter_clients, read_trace
+
+INPUT_FILE = "tests/input_test.txt"
+
+
+def test_read_limits():
+    assert read_limits(io.StringIO("4\n2\n1\n")) == (4, 2)
+
+
+def test_read_limits_not_integer():
+    with raises(BalancerError) as e:
+        read_limits(io.StringIO("a\n2\n"))
+    assert "must be an integer" in str(e)
+
+
+def test_read_limits_out_of_range():
+    with raises(BalancerError) as e:
+        read_limits(io.StringIO("4\n11\n"))
+    assert "umax must be lesser then" in str(e)
+
+
+def test_iter_clients():
+    assert list(iter_clients(io.StringIO("1\n3\n0\n1\n"), 4)) == [1, 3, 0, 1]
+
+
+def test_iter_clients_not_integer():
+    assert list(iter_clients(io.StringIO("1\n\n3\n"), 4)) == [1, 0, 3]
+
+
+def test_iter_clients_not_integer_idle():
+    assert list(iter_clients(io.StringIO("1\na\n\n3\n"), 1)) == [1, 0]
+
+
+def test_iter_clients_leading_zero():
+    assert list(iter_clients(io.StringIO("0\n3\n"), 4)) == []
+
+
+def test_iter_clients_idle():
+    assert list(iter_clients(io.StringIO("1\n0\n0\n0\n3\n"), 2)) == [1, 0, 0]
+
+
+def test_read_trace():
+    assert read_trace(INPUT_FILE) == (4, 2, [1, 3, 0, 1, 0, 1])